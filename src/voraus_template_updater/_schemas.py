@@ -1,16 +1,21 @@
-"""Contains Pydantic models for the project updater."""
+"""Contains the data models for the project updater."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 from typing import Dict, List, Optional
 
 from github.PullRequest import PullRequest
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 from rich import box
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 from rich.text import Text
 
+_CONSOLE = Console()
+
 
 class CruftConfig(BaseModel):
     """A cruft config as can be found in a '.cruft.json' file."""
@@ -30,7 +35,8 @@ class Status(Enum):
     EXISTING_PR = "Existing PR since {} ({} days)"
 
 
-class SkippedProject(BaseModel):
+@dataclass
+class SkippedProject:
     """Contains information about a skipped project and why it was skipped."""
 
     name: str
@@ -38,97 +44,98 @@ class SkippedProject(BaseModel):
     reason: str
 
 
-class Project(BaseModel):
+@dataclass
+class Project:
     """Contains information about a Python project that is maintained via a template."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     name: str
     url: str
-    maintainer: Optional[str] = None
     default_branch: str
     template_url: str
     template_branch: str
     old_template_commit: str
     status: Status
+    maintainer: Optional[str] = None
     pull_request: Optional[PullRequest] = None
 
 
-class Summary(BaseModel):
+@dataclass
+class Summary:
     """A summary of the checked and updates projects."""
 
-    projects: List[Project] = []
-    skipped_projects: List[SkippedProject] = []
+    projects: List[Project] = field(default_factory=list)
+    skipped_projects: List[SkippedProject] = field(default_factory=list)
+
+    def print(self, console: Optional[Console] = None) -> None:
+        """Prints the summary.
+
+        Args:
+            console: The console to print to. Defaults to a console that prints to stdout.
+        """
+        console = console or _CONSOLE
 
-    def print(self) -> None:
-        """Prints the summary."""
         if len(self.projects) > 0:
-            _print_table_of_projects(self.projects)
+            _print_table_of_projects(self.projects, console)
 
         if len(self.skipped_projects) > 0:
-            print("\n")
-            _print_table_of_skipped_projects(self.skipped_projects)
+            console.print("\n")
+            _print_table_of_skipped_projects(self.skipped_projects, console)
 
 
-def _print_table_of_projects(projects: List[Project]) -> None:
+def _print_table_of_projects(projects: List[Project], console: Console) -> None:
     title = _get_table_title(projects)
     table = Table(title=title, box=box.SQUARE)
     table.add_column("Maintainer")
     table.add_column("Projects")
 
     projects_by_maintainer = _get_projects_by_maintainer(projects)
+    now = datetime.now().replace(tzinfo=None)
 
     for maintainer, maintainers_projects in projects_by_maintainer.items():
-        details = Text()
+        details: List[str] = []
         maintainer_color = "green"
 
         for project in maintainers_projects:
-            if project.status == Status.UP_TO_DATE:
+            if project.status is Status.UP_TO_DATE:
                 project_status = project.status.value
                 status_color = "green"
-            elif project.status == Status.UPDATED_THIS_RUN:
+            elif project.status is Status.UPDATED_THIS_RUN:
                 project_status = project.status.value
                 status_color = "yellow"
                 maintainer_color = "red"
             else:
                 assert project.pull_request is not None
-                creation_date = datetime.strftime(project.pull_request.created_at, "%Y-%m-%d")
-                open_since = (
-                    datetime.now().replace(tzinfo=None) - project.pull_request.created_at.replace(tzinfo=None)
-                ).days
+                creation_date = project.pull_request.created_at.date().isoformat()
+                open_since = (now - project.pull_request.created_at.replace(tzinfo=None)).days
 
                 project_status = project.status.value.format(creation_date, open_since)
                 status_color = "red"
                 maintainer_color = "red"
 
-            details.append("Project:         ")
-            details.append(project.name)
-            details.append("\nURL:             ")
-            details.append(project.url)
-            details.append("\nStatus:          ", status_color)
-            details.append(project_status, status_color)
+            details.append(
+                f"Project:         {escape(project.name)}\n"
+                f"URL:             {escape(project.url)}\n"
+                f"[{status_color}]Status:          {escape(project_status)}[/]\n"
+            )
 
-            if project.status != Status.UP_TO_DATE:
+            if project.status is not Status.UP_TO_DATE:
                 assert project.pull_request is not None
-                details.append("\nPull request:    ", status_color)
-                details.append(project.pull_request.html_url, status_color)
+                details.append(f"[{status_color}]Pull request:    {escape(project.pull_request.html_url)}[/]\n")
 
-            details.append("\nDefault branch:  ")
-            details.append(project.default_branch)
-            details.append("\nTemplate URL:    ")
-            details.append(project.template_url)
-            details.append("\nTemplate branch: ")
-            details.append(project.template_branch)
-            details.append("\n\n")
+            details.append(
+                f"Default branch:  {escape(project.default_branch)}\n"
+                f"Template URL:    {escape(project.template_url)}\n"
+                f"Template branch: {escape(project.template_branch)}\n\n"
+            )
 
-        table.add_row(Text(maintainer or "None", maintainer_color), details)
+        table.add_row(Text(maintainer or "None", maintainer_color), Text.from_markup("".join(details)))
 
-    Console().print(table)
+    console.print(table)
 
 
 def _get_table_title(projects: List[Project]) -> str:
     processed_projects = len(projects)
-    up_to_date_projects = len(list(filter(lambda p: p.status == Status.UP_TO_DATE, projects)))
+    up_to_date_projects = sum(1 for project in projects if project.status is Status.UP_TO_DATE)
 
     return (
         f"Projects: {processed_projects}   "
@@ -140,23 +147,20 @@ def _get_table_title(projects: List[Project]) -> str:
 def _get_projects_by_maintainer(projects: List[Project]) -> Dict[Optional[str], List[Project]]:
     projects_by_maintainer: Dict[Optional[str], List[Project]] = {}
 
-    for project in sorted(
-        projects, key=lambda x: x.maintainer or "z" * 100  # Projects without maintainers sorted to end
-    ):
-        if project.maintainer not in projects_by_maintainer:
-            projects_by_maintainer[project.maintainer] = [project]
-        else:
-            projects_by_maintainer[project.maintainer].append(project)
-    return projects_by_maintainer
+    for project in projects:
+        projects_by_maintainer.setdefault(project.maintainer, []).append(project)
+
+    # Only the maintainers are sorted, projects without maintainers are sorted to the end
+    return dict(sorted(projects_by_maintainer.items(), key=lambda item: (item[0] is None, item[0] or "")))
 
 
-def _print_table_of_skipped_projects(projects: List[SkippedProject]) -> None:
+def _print_table_of_skipped_projects(projects: List[SkippedProject], console: Console) -> None:
     table = Table(title=f"Skipped projects: {len(projects)}", box=box.SQUARE)
     table.add_column("Project")
     table.add_column("URL")
     table.add_column("Skip reason")
 
-    for project in sorted(projects, key=lambda p: p.reason):
+    for project in sorted(projects, key=attrgetter("reason")):
         table.add_row(project.name, project.url, project.reason)
 
-    Console().print(table)
+    console.print(table)
@@ -1,19 +1,30 @@
 """Checks and updates GitHub repositories that are based on a cookiecutter template and managed with cruft."""
 
+import base64
+import hashlib
+import json
 import logging
 import os
 import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import List, Optional
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Union
 
 import cruft
 import git
 import requests
+from git.objects import Commit
 from git.repo import Repo
 from github import Github
-from github.GithubException import GithubException
+from github.GithubException import GithubException, RateLimitExceededException, UnknownObjectException
+from github.Issue import Issue
 from github.PullRequest import PullRequest as GitHubPullRequest
 from github.Repository import Repository
 from requests import HTTPError
@@ -27,6 +38,30 @@ PR_TITLE = "chore(template): Update template"
 PR_BODY_HEADER = (
     "Contains the following changes to get up-to-date with the newest version of the template's '{}' branch.\n\n"
 )
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_CRUFT_JSON_QUERY = """
+query($organization: String!, $cursor: String) {
+  organization(login: $organization) {
+    repositories(first: 100, after: $cursor, isFork: false) {
+      nodes {
+        name
+        cruftJson: object(expression: "HEAD:.cruft.json") {
+          ... on Blob {
+            text
+            isTruncated
+          }
+        }
+      }
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
+    }
+  }
+}
+"""
+_PR_TITLES: FrozenSet[str] = frozenset((PR_TITLE,) + PR_TITLE_LEGACY)
+_PR_REFERENCE_PATTERN = re.compile(r"\(#(\d+)\)")  # A pull request reference like "(#123)" in a commit title
 
 _logger = logging.getLogger("voraus_template_updater")
 _logger.setLevel(logging.INFO)
@@ -34,6 +69,10 @@ _console_handler = logging.StreamHandler()
 _console_handler.formatter = logging.Formatter("[%(name)-20s][%(levelname)-8s] %(message)s")
 _logger.addHandler(_console_handler)
 
+_cruft_update_lock = threading.Lock()
+# Reuses connections to the GitHub API instead of opening a new connection for each request
+_http_session = requests.Session()
+
 app = Typer(add_completion=False)
 
 
@@ -58,78 +97,210 @@ def _check_and_update_projects(  # pylint: disable=dangerous-default-value # Onl
             "different variable names to define a maintainer. The first hit from the list will be used."
         ),
     ] = ["full_name"],
+    max_workers: Annotated[
+        int,
+        Option(
+            min=1,
+            help="The number of repositories that are processed concurrently. Lower it if GitHub rate limits are hit.",
+        ),
+    ] = 8,
 ) -> Summary:
     summary = Summary()
 
     github_access_token = github_access_token or os.environ["GITHUB_TOKEN"]
 
-    for repo in Github(github_access_token).get_organization(github_organization).get_repos():
-        if repo.archived:
-            _logger.info(f"Skipped '{repo.name}'. Project archived.")
-            summary.skipped_projects.append(
-                SkippedProject(name=repo.name, url=repo.html_url, reason="Project archived")
-            )
-            continue
+    # Request as many items per page as possible to reduce the number of requests when listing repositories
+    github = Github(github_access_token, per_page=100)
+    repos = github.get_organization(github_organization).get_repos(type="sources")  # Forks are not processed
+    # The search API has a much lower rate limit than the rest of the API. Without retries, a search that exceeds it
+    # fails right away to fall back to listing pull requests instead of waiting for the rate limit to reset.
+    search_github = Github(github_access_token, per_page=100, retry=None)
+
+    cache_dir = _get_cache_dir()
+    template_dir = cache_dir / "templates"
+    template_dir.mkdir(parents=True, exist_ok=True)
+
+    context = _RunContext(
+        github_access_token=github_access_token,
+        maintainer_fields=maintainer_field,
+        existing_pull_requests=_search_existing_pull_requests(search_github, github_organization),
+        cruft_json_files=_get_cruft_json_files(github_organization, github_access_token),
+        template_repos=_TemplateRepos(github_access_token, template_dir),
+        up_to_date_checks=_UpToDateChecks(cache_dir / "state.json"),
+        # All projects updated in a run get the same branch name, which makes the pull requests of a run easy to relate
+        update_branch=f"chore/update-template-{datetime.now().isoformat(timespec='seconds').replace(':', '-')}",
+    )
 
-        try:
-            cruft_config = _get_cruft_config(repo)
-        except GithubException:
-            _logger.info(f"Skipped '{repo.name}'. Project does not have a '.cruft.json' file.")
-            summary.skipped_projects.append(
-                SkippedProject(name=repo.name, url=repo.html_url, reason="No '.cruft.json' file")
-            )
-            continue
-        except HTTPError:
-            _logger.warning(
-                f"Skipped '{repo.name}'. Failed to retrieve '.cruft.json' file although the project has one."
-            )
-            summary.skipped_projects.append(
-                SkippedProject(name=repo.name, url=repo.html_url, reason="Cannot download '.cruft.json' file")
-            )
-            continue
+    # Processing a repository mostly waits for the GitHub API and git, so repositories are processed concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(partial(_process_repo, context), repos):
+            if isinstance(result, SkippedProject):
+                summary.skipped_projects.append(result)
+            else:
+                summary.projects.append(result)
 
-        template_url = cruft_config.template
+    context.up_to_date_checks.save()
 
-        maintainer = _get_maintainer(maintainer_field, cruft_config)
+    summary.print()
 
-        project = Project(
-            name=repo.name,
-            url=repo.html_url,
-            maintainer=maintainer,
-            default_branch=repo.default_branch,
-            template_url=template_url,
-            template_branch=cruft_config.checkout or "main",
-            old_template_commit=cruft_config.commit,
-            status=Status.UP_TO_DATE,
-        )
+    return summary
 
-        if (pull_request := _get_existing_pull_request(repo)) is not None:
-            _logger.info(f"Skipped '{repo.name}'. Project already has an active pull request for a template update.")
-            summary.projects.append(
-                project.model_copy(update={"status": Status.EXISTING_PR, "pull_request": pull_request})
-            )
-            continue
 
-        with TemporaryDirectory() as tmp_path:
-            local_repo = _clone_repo(repo.clone_url, github_access_token, Path(tmp_path))
+def _get_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "voraus-template-updater"
+
+
+@dataclass(frozen=True)
+class _RunContext:
+    """Contains everything that is shared by the repositories processed in a run."""
+
+    github_access_token: str
+    maintainer_fields: List[str]
+    existing_pull_requests: Optional[Dict[str, Issue]]
+    cruft_json_files: Dict[str, Optional[str]]
+    template_repos: "_TemplateRepos"
+    up_to_date_checks: "_UpToDateChecks"
+    update_branch: str
+
+
+def _process_repo(context: _RunContext, repo: Repository) -> Union[Project, SkippedProject]:
+    try:
+        return _check_and_update_repo(context, repo)
+    # A failure in one repository must not abort the run, which would leave out the summary for all other repositories
+    except Exception:  # pylint: disable=broad-exception-caught
+        _logger.exception(f"Skipped '{repo.name}'. Failed to process the project.")
+        return SkippedProject(name=repo.name, url=repo.html_url, reason="Processing failed")
+
+
+def _check_and_update_repo(context: _RunContext, repo: Repository) -> Union[Project, SkippedProject]:
+    if repo.archived:
+        _logger.info(f"Skipped '{repo.name}'. Project archived.")
+        return SkippedProject(name=repo.name, url=repo.html_url, reason="Project archived")
+
+    try:
+        cruft_config = _get_cruft_config(repo, context.cruft_json_files)
+    except GithubException:
+        _logger.info(f"Skipped '{repo.name}'. Project does not have a '.cruft.json' file.")
+        return SkippedProject(name=repo.name, url=repo.html_url, reason="No '.cruft.json' file")
+    except HTTPError:
+        _logger.warning(f"Skipped '{repo.name}'. Failed to retrieve '.cruft.json' file although the project has one.")
+        return SkippedProject(name=repo.name, url=repo.html_url, reason="Cannot download '.cruft.json' file")
+
+    project = Project(
+        name=repo.name,
+        url=repo.html_url,
+        maintainer=_get_maintainer(context.maintainer_fields, cruft_config),
+        default_branch=repo.default_branch,
+        template_url=cruft_config.template,
+        template_branch=cruft_config.checkout or "main",
+        old_template_commit=cruft_config.commit,
+        status=Status.UP_TO_DATE,
+    )
 
-            _logger.info(f"Checking '{repo.name}'")
+    if (pull_request := _get_existing_pull_request(context.existing_pull_requests, repo)) is not None:
+        _logger.info(f"Skipped '{repo.name}'. Project already has an active pull request for a template update.")
+        return replace(project, status=Status.EXISTING_PR, pull_request=pull_request)
 
-            if cruft.check(Path(local_repo.working_dir), project.template_branch) is True:
-                summary.projects.append(project)
-                continue
+    _logger.info(f"Checking '{repo.name}'")
 
-            pull_request = _update_project(repo, local_repo, project, github_access_token)
-            summary.projects.append(
-                project.model_copy(update={"status": Status.UPDATED_THIS_RUN, "pull_request": pull_request})
-            )
+    with context.template_repos.get(project.template_url) as template_repo:
+        newest_template_commit = template_repo.git.rev_parse(f"{project.template_branch}^{{commit}}")
 
-    summary.print()
+    if _is_up_to_date(project, cruft_config, newest_template_commit, context.up_to_date_checks):
+        return project
 
-    return summary
+    pull_request = _clone_and_update_project(context, repo, project, newest_template_commit)
+    return replace(project, status=Status.UPDATED_THIS_RUN, pull_request=pull_request)
+
+
+def _is_up_to_date(
+    project: Project, cruft_config: CruftConfig, newest_template_commit: str, up_to_date_checks: "_UpToDateChecks"
+) -> bool:
+    # A project that is based on the newest template commit is up to date without running cruft
+    if newest_template_commit == project.old_template_commit:
+        return True
+
+    # The result of a check only depends on the template commits, so it is reused across runs until either changes
+    check = (
+        f"{project.template_url}:{cruft_config.directory or ''}:{project.old_template_commit}..{newest_template_commit}"
+    )
+    if up_to_date_checks.contains(check):
+        return True
+
+    # cruft only reads the '.cruft.json' file to check a project, so the project is only cloned to update it
+    with TemporaryDirectory() as tmp_path:
+        (Path(tmp_path) / ".cruft.json").write_text(cruft_config.model_dump_json(), encoding="utf-8")
+        if cruft.check(Path(tmp_path), project.template_branch) is not True:
+            return False
+
+    up_to_date_checks.add(check)
+    return True
+
+
+def _clone_and_update_project(
+    context: _RunContext, repo: Repository, project: Project, newest_template_commit: str
+) -> GitHubPullRequest:
+    with TemporaryDirectory() as tmp_path:
+        # Updating only needs the newest commit of the default branch to create a new branch from
+        local_repo = _clone_repo(
+            repo.clone_url, context.github_access_token, Path(tmp_path), depth=1, branch=project.default_branch
+        )
+        return _update_project(
+            repo, local_repo, project, context.template_repos, newest_template_commit, context.update_branch
+        )
+
+
+def _get_cruft_json_files(github_organization: str, github_access_token: str) -> Dict[str, Optional[str]]:
+    """Retrieves the '.cruft.json' files of all repositories in an organization with as few requests as possible.
+
+    Args:
+        github_organization: The GitHub organization to retrieve the files for.
+        github_access_token: The GitHub token used to access the GraphQL API.
+
+    Returns:
+        The content of each repository's '.cruft.json' file by repository name or None if the repository does not
+        have one. Repositories whose file could not be retrieved are left out.
+    """
+    cruft_json_files: Dict[str, Optional[str]] = {}
+    cursor = None
 
+    try:
+        while True:
+            response = _http_session.post(
+                _GRAPHQL_URL,
+                json={"query": _CRUFT_JSON_QUERY, "variables": {"organization": github_organization, "cursor": cursor}},
+                headers={"Authorization": f"bearer {github_access_token}"},
+                timeout=30,
+            )
+            response.raise_for_status()
+            repositories = response.json()["data"]["organization"]["repositories"]
+
+            for repository in repositories["nodes"]:
+                cruft_json = repository["cruftJson"]
+                if cruft_json is None:
+                    cruft_json_files[repository["name"]] = None
+                elif cruft_json.get("text") is not None and not cruft_json.get("isTruncated"):
+                    cruft_json_files[repository["name"]] = cruft_json["text"]
+
+            # Stop on anything but a further page with a new cursor to never request the same page forever
+            page_info = repositories["pageInfo"]
+            if page_info["hasNextPage"] is not True or not isinstance(page_info["endCursor"], str):
+                return cruft_json_files
+            if page_info["endCursor"] == cursor:
+                return cruft_json_files
+            cursor = page_info["endCursor"]
+    except (requests.RequestException, ValueError, KeyError, TypeError):
+        _logger.warning("Failed to retrieve '.cruft.json' files in bulk. Retrieving them per repository instead.")
+        return cruft_json_files
+
+
+def _get_cruft_config(repo: Repository, cruft_json_files: Optional[Dict[str, Optional[str]]] = None) -> CruftConfig:
+    if cruft_json_files is not None and repo.name in cruft_json_files:
+        if (cruft_json_file := cruft_json_files[repo.name]) is None:
+            # Behave like the contents API, which responds with 404 for missing files
+            raise UnknownObjectException(404, message=f"Repository '{repo.name}' does not have a '.cruft.json' file.")
+        return CruftConfig.model_validate_json(cruft_json_file)
 
-def _get_cruft_config(repo: Repository) -> CruftConfig:
     cruft_json = repo.get_contents(".cruft.json")
     if isinstance(cruft_json, List):
         raise RuntimeError(
@@ -137,7 +308,11 @@ def _get_cruft_config(repo: Repository) -> CruftConfig:
             "This use case is currently not supported."
         )
 
-    response = requests.get(cruft_json.download_url, timeout=10)
+    # The GitHub API already includes the content of files up to 1 MB in the response, which saves a download
+    if cruft_json.encoding == "base64":
+        return CruftConfig.model_validate_json(cruft_json.decoded_content)
+
+    response = _http_session.get(cruft_json.download_url, timeout=10)
     response.raise_for_status()
 
     return CruftConfig.model_validate_json(response.content)
@@ -152,35 +327,250 @@ def _get_maintainer(maintainer_fields: List[str], cruft_config: CruftConfig) ->
     return maintainer
 
 
-def _clone_repo(repo_url: str, github_access_token: str, target_path: Path) -> Repo:
-    url = repo_url.replace("git@github.com:", "https://github.com/")
-    url = url[:-4] if url.endswith(".git") else url  # str.removesuffix only supported by Python >= 3.9
-    url = url.replace("github.com", f"x-access-token:{github_access_token}@github.com")
+class _TemplateRepos:
+    """Keeps a bare clone of each template repository in a persistent cache directory.
+
+    Each template is cloned on first use and updated with a fetch in later runs. Within a run, a template is only
+    fetched once, no matter how many projects are based on it. The cache directory is not locked, so runs must not
+    share it concurrently.
+
+    Args:
+        github_access_token: The GitHub token used to clone and fetch the template repositories.
+        cache_dir: The directory to keep the template repositories in.
+    """
+
+    def __init__(self, github_access_token: str, cache_dir: Path) -> None:
+        self._github_access_token = github_access_token
+        self._cache_dir = cache_dir
+        self._repos: Dict[str, Repo] = {}
+        self._errors: Dict[str, RuntimeError] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    @contextmanager
+    def get(self, template_url: str) -> Iterator[Repo]:
+        """Provides exclusive access to the up-to-date clone of a template repository.
+
+        Access is exclusive because GitPython repository objects must not be used by several threads at once.
+
+        Args:
+            template_url: The URL of the template repository.
+
+        Yields:
+            The cloned template repository.
+
+        Raises:
+            RuntimeError: If the cached clone of the template repository could not be updated in this run.
+        """
+        with self._locks_lock:
+            lock = self._locks.setdefault(template_url, threading.Lock())
+
+        with lock:
+            # A template that could not be updated fails all of its projects instead of fetching it again for each one
+            if template_url in self._errors:
+                raise self._errors[template_url]
+
+            if template_url not in self._repos:
+                try:
+                    self._repos[template_url] = self._fetch_or_clone(template_url)
+                except RuntimeError as error:
+                    self._errors[template_url] = error
+                    raise
+
+            yield self._repos[template_url]
+
+    def _fetch_or_clone(self, template_url: str) -> Repo:
+        repo_path = self._cache_dir / hashlib.sha256(template_url.encode()).hexdigest()
+
+        if repo_path.exists():
+            try:
+                repo = git.Repo(repo_path)
+            except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+                _logger.warning(f"The cached clone of '{template_url}' is broken. Cloning it again.")
+                shutil.rmtree(repo_path)
+            else:
+                try:
+                    # A fetch with a filter keeps the URL it fetches from in the config of the repository. So the
+                    # token is only passed to this command instead of being part of the URL.
+                    repo.git(c=_get_authentication_config(self._github_access_token)).fetch(
+                        "--prune",
+                        *(["--filter=tree:0"] if _supports_partial_clone() else []),
+                        "origin",
+                        "+refs/heads/*:refs/heads/*",
+                        "+refs/tags/*:refs/tags/*",
+                    )
+                except git.GitCommandError as error:
+                    # An outdated clone would report outdated projects as up to date, so it must not be used. The error
+                    # is not chained, because its command line contains the token.
+                    raise RuntimeError(
+                        f"Failed to update the cached clone of '{template_url}'.{error.stderr}"
+                    ) from None
+                return repo
+
+        # Only the commit messages of a template are needed, which require neither a working tree nor trees or blobs.
+        # A bare clone also maps every remote branch to a local one.
+        repo = _clone_repo(template_url, self._github_access_token, repo_path, object_filter="tree:0", bare=True)
+        # The URL used for cloning contains the access token, which must not be kept in the cache directory
+        repo.git.remote("set-url", "origin", _get_https_url(template_url))
+        return repo
+
+
+class _UpToDateChecks:
+    """Remembers the cruft checks that found a project to be up to date across runs.
+
+    Only the checks that are used in a run are kept for the next one, so outdated checks do not pile up.
+
+    Args:
+        state_file: The file to keep the checks in.
+    """
+
+    def __init__(self, state_file: Path) -> None:
+        self._state_file = state_file
+        self._checks: Set[str] = set()
+        self._lock = threading.Lock()
+
+        try:
+            self._previous_checks = set(json.loads(state_file.read_text(encoding="utf-8"))["up_to_date_checks"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self._previous_checks = set()
+
+    def contains(self, check: str) -> bool:
+        """Returns whether a check found a project to be up to date in the previous run and keeps it if so.
+
+        Args:
+            check: The identifier of the check.
+
+        Returns:
+            True if the check found a project to be up to date, otherwise False.
+        """
+        if check not in self._previous_checks:
+            return False
+
+        self.add(check)
+        return True
+
+    def add(self, check: str) -> None:
+        """Adds a check that found a project to be up to date.
+
+        Args:
+            check: The identifier of the check.
+        """
+        with self._lock:
+            self._checks.add(check)
+
+    def save(self) -> None:
+        """Saves the checks of this run for the next one.
+
+        A failure to save is only logged, because it merely leads to the checks being run again in the next run.
+        """
+        try:
+            self._state_file.write_text(json.dumps({"up_to_date_checks": sorted(self._checks)}), encoding="utf-8")
+        except OSError as error:
+            _logger.warning(f"Failed to save the up-to-date checks to '{self._state_file}': {error}")
+
+
+def _clone_repo(
+    repo_url: str,
+    github_access_token: str,
+    target_path: Path,
+    object_filter: Optional[str] = None,
+    bare: bool = False,
+    depth: Optional[int] = None,
+    branch: Optional[str] = None,
+) -> Repo:
+    multi_options = []
+    if bare:
+        multi_options.append("--bare")
+    if depth is not None:
+        multi_options.append(f"--depth={depth}")
+    if branch is not None:
+        multi_options.extend([f"--branch={branch}", "--single-branch"])
+    if object_filter and _supports_partial_clone():
+        # A partial clone only downloads the objects that are filtered out once they are actually needed
+        multi_options.append(f"--filter={object_filter}")
 
     return git.Repo.clone_from(
-        url=url,
+        url=_get_authenticated_url(repo_url, github_access_token),
         to_path=target_path,
+        multi_options=multi_options or None,
     )
 
 
-def _get_existing_pull_request(repo: Repository) -> Optional[GitHubPullRequest]:
+@lru_cache(maxsize=None)
+def _supports_partial_clone() -> bool:
+    # Partial clones work reliably since git 2.27
+    return git.Git().version_info >= (2, 27)
+
+
+@lru_cache(maxsize=512)
+def _get_authenticated_url(repo_url: str, github_access_token: str) -> str:
+    return _get_https_url(repo_url).replace("github.com", f"x-access-token:{github_access_token}@github.com")
+
+
+def _get_authentication_config(github_access_token: str) -> str:
+    # The header is only sent to GitHub, so the token is not leaked to templates that are hosted elsewhere
+    credentials = base64.b64encode(f"x-access-token:{github_access_token}".encode()).decode()
+    return f"http.https://github.com/.extraHeader=Authorization: Basic {credentials}"
+
+
+def _get_https_url(repo_url: str) -> str:
+    url = repo_url.replace("git@github.com:", "https://github.com/")
+    return url[:-4] if url.endswith(".git") else url  # str.removesuffix only supported by Python >= 3.9
+
+
+def _search_existing_pull_requests(search_github: Github, github_organization: str) -> Optional[Dict[str, Issue]]:
+    """Searches for the open template update pull requests of all repositories in an organization at once.
+
+    Args:
+        search_github: The GitHub client used for searching.
+        github_organization: The GitHub organization to search in.
+
+    Returns:
+        The found pull requests as issues by repository name or None if the search failed.
+    """
+    # All known titles are searched for with a single query to only use one request of the search rate limit
+    titles = " OR ".join(f'"{title}"' for title in sorted(_PR_TITLES))
+    existing_pull_requests: Dict[str, Issue] = {}
+    try:
+        for issue in search_github.search_issues(f"org:{github_organization} is:pr is:open in:title {titles}"):
+            if issue.title in _PR_TITLES:  # The search also matches titles that only contain the searched words
+                # Parsing the URL avoids the request that resolving the issue's repository would take
+                existing_pull_requests.setdefault(issue.repository_url.rsplit("/", 1)[-1], issue)
+    except RateLimitExceededException:
+        _logger.debug("Search rate limit exceeded. Scanning the open pull requests of each repository instead.")
+        return None
+    return existing_pull_requests
+
+
+def _get_existing_pull_request(
+    existing_pull_requests: Optional[Dict[str, Issue]], repo: Repository
+) -> Optional[GitHubPullRequest]:
+    if existing_pull_requests is not None:
+        issue = existing_pull_requests.get(repo.name)
+        return issue.as_pull_request() if issue is not None else None
+
     for pull_request in repo.get_pulls():
-        if pull_request.title in (PR_TITLE,) + PR_TITLE_LEGACY:
+        if pull_request.title in _PR_TITLES:
             return pull_request
     return None
 
 
 def _update_project(
-    remote_repo: Repository, local_repo: Repo, project: Project, github_access_token: str
+    remote_repo: Repository,
+    local_repo: Repo,
+    project: Project,
+    template_repos: "_TemplateRepos",
+    newest_template_commit: str,
+    update_branch: str,
 ) -> GitHubPullRequest:
-    branch = local_repo.create_head(
-        f"chore/update-template-{datetime.isoformat(datetime.now(), timespec='seconds').replace(':', '-')}"
-    )
+    branch = local_repo.create_head(update_branch)
     branch.checkout()
 
-    cruft.update(Path(local_repo.working_dir), checkout=project.template_branch)
+    # cruft changes the working directory of the process while updating, so updates must not run concurrently
+    with _cruft_update_lock:
+        cruft.update(Path(local_repo.working_dir), checkout=project.template_branch)
 
-    template_commit_messages = _get_template_commit_messages(project, github_access_token)
+    template_commit_messages = _get_template_commit_messages(project, template_repos, newest_template_commit)
     local_repo.git.add(all=True)
     if len(template_commit_messages) == 1:
         local_repo.index.commit(template_commit_messages[0])
@@ -203,31 +593,27 @@ def _update_project(
     return pull_request
 
 
-def _get_template_commit_messages(project: Project, github_access_token: str) -> List[str]:
-    with TemporaryDirectory() as tmp_path:
-        template_repo = _clone_repo(project.template_url, github_access_token, Path(tmp_path))
-
-        template_repo.git.checkout(project.template_branch)
-        newest_template_commit = template_repo.git.rev_parse(project.template_branch)
-        commits = list(template_repo.iter_commits(f"{project.old_template_commit}..{newest_template_commit}"))
-
-        commit_messages = [
-            commit.message if isinstance(commit.message, str) else commit.message.decode() for commit in commits
-        ]
-
+def _get_template_commit_messages(
+    project: Project, template_repos: "_TemplateRepos", newest_template_commit: str
+) -> List[str]:
     # The first line of a commit from a pull request usually contains a reference to the GitHub pull request, for
     # example `feat: Added feature (#123)`. However GitHub will resolve these links to the current repository although
     # they refer to pull requests in the template repository. We therefore need to change these links to point to the
     # pull requests in the template repository.
-    link = project.template_url.replace("git@github.com:", "https://github.com/")
-    link = link[:-4] if link.endswith(".git") else link  # str.removesuffix only supported by Python >= 3.9
-    link += "/pull/{}"
-    for i_message, message in enumerate(commit_messages):
-        commit_messages[i_message] = re.sub(
-            r"\(#(\d+)\)", lambda match: f"([PR]({link.format(match.groups()[0])}))", message
-        )
+    # The pull request number is inserted by a backreference, so the replacement is only built once for all commits
+    pr_link_replacement = f"([PR]({_get_https_url(project.template_url)}/pull/\\g<1>))"
+
+    with template_repos.get(project.template_url) as template_repo:
+        return [
+            _get_commit_message(commit, pr_link_replacement)
+            for commit in template_repo.iter_commits(f"{project.old_template_commit}..{newest_template_commit}")
+        ]
+
 
-    return commit_messages
+def _get_commit_message(commit: Commit, pr_link_replacement: str) -> str:
+    # GitPython only returns bytes if a commit message cannot be decoded with the commit's encoding
+    message = commit.message if isinstance(commit.message, str) else commit.message.decode()
+    return _PR_REFERENCE_PATTERN.sub(pr_link_replacement, message)
 
 
 def _get_pr_title(template_commit_messages: List[str]) -> str:
@@ -240,20 +626,18 @@ def _get_pr_title(template_commit_messages: List[str]) -> str:
 
 def _get_pr_body(project: Project, template_commit_messages: List[str]) -> str:
     if len(template_commit_messages) == 1:
-        message = template_commit_messages[0]
-        lines = message.strip().splitlines()
-        if len(lines) > 1:
-            return "".join(message.strip().splitlines()[1:])
-        return ""
+        lines = template_commit_messages[0].strip().splitlines()
+        # The blank line that separates a commit's title and body is not part of the pull request body
+        return "\n".join(lines[1:]).strip()
 
     # Indent all lines after the first line of a commit message by two spaces
     # This leads to nicer bullet points in the pull request body
-    template_commit_messages = [
+    bullet_points = "\n\n- ".join(
         "\n  ".join(commit_message.strip().splitlines()) for commit_message in template_commit_messages
-    ]
+    )
 
     # Construct a pull request message containing the PR header and a bullet point list of changes and their explanation
-    return PR_BODY_HEADER.format(project.template_branch) + "- " + "\n\n- ".join(template_commit_messages) + "\n"
+    return f"{PR_BODY_HEADER.format(project.template_branch)}- {bullet_points}\n"
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,10 +1,12 @@
 """Contains schema unit tests."""
 
 from datetime import datetime
+from io import StringIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from pytest import CaptureFixture
+from rich.console import Console
 
 from tests.resources.example_summary import summary
 
@@ -14,8 +16,17 @@ NOW = datetime(2023, 12, 15)
 @patch("voraus_template_updater._schemas.datetime")
 def test_summary_printing(datetime_mock: MagicMock, capsys: CaptureFixture, resource_dir: Path) -> None:
     datetime_mock.now.return_value = NOW
-    datetime_mock.strftime = datetime.strftime
     summary.print()
     stdout = capsys.readouterr().out
 
     assert stdout == (resource_dir / "example_summary_output.txt").read_text(encoding="utf-8")
+
+
+@patch("voraus_template_updater._schemas.datetime")
+def test_summary_printing_to_console(datetime_mock: MagicMock, capsys: CaptureFixture, resource_dir: Path) -> None:
+    datetime_mock.now.return_value = NOW
+    output = StringIO()
+    summary.print(Console(file=output, width=80))
+
+    assert capsys.readouterr().out == ""
+    assert output.getvalue() == (resource_dir / "example_summary_output.txt").read_text(encoding="utf-8")
@@ -1 +1,37 @@
 """This module contains utility functions for tests."""
+
+import logging
+
+import pytest
+
+LOGGER_NAME = "voraus_template_updater"
+
+
+def assert_logged(caplog: pytest.LogCaptureFixture, level: int, message: str) -> None:
+    """Asserts that the template updater logged a message, no matter what else was logged.
+
+    Args:
+        caplog: The fixture that captured the logs.
+        level: The expected log level.
+        message: The expected log message.
+    """
+    assert any(
+        record.name == LOGGER_NAME and record.levelno == level and record.getMessage() == message
+        for record in caplog.records
+    ), f"{logging.getLevelName(level)} '{message}' was not logged."
+
+
+def assert_single_log(caplog: pytest.LogCaptureFixture, level: int, message: str) -> None:
+    """Asserts that the template updater logged exactly one message, which is the expected one.
+
+    Logs of other loggers, for example of third party libraries, are ignored.
+
+    Args:
+        caplog: The fixture that captured the logs.
+        level: The expected log level.
+        message: The expected log message.
+    """
+    records = [record for record in caplog.records if record.name == LOGGER_NAME]
+
+    assert len(records) == 1, f"Expected a single log, got {len(records)}."
+    assert (records[0].levelno, records[0].getMessage()) == (level, message)